@@ -5,6 +5,7 @@ setup(
     version="0.1.0",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"betterdeal": ["static/*"]},
     install_requires=[
         "mcp[cli]>=1.3.0",
         "httpx>=0.24.0",
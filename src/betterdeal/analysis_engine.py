@@ -6,15 +6,20 @@ IRR/NPV, tax analysis, risk stress testing, comparable market analysis,
 and scoring for all 5 strategies.
 """
 
+import asyncio
+import bisect
+import functools
 import math
 import re
 import statistics
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 
 from pydantic import BaseModel, Field
 
 from .loan_calculator import LoanCalculator
 from .rentcast_client import RentCastClient
+from .url_parser import PropertyURLParser
 
 
 # ---------------------------------------------------------------------------
@@ -89,7 +94,8 @@ class TaxAnalysis(BaseModel):
     marginal_tax_rate: float = 0.22
 
 
-class StressScenario(BaseModel):
+@dataclass(slots=True, frozen=True)
+class StressScenario:
     """Single stress test result."""
     name: str
     description: str
@@ -115,7 +121,8 @@ class RiskAnalysis(BaseModel):
     overall_risk_score: float = 0.0  # 0-100, higher = riskier
 
 
-class CompProperty(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CompProperty:
     """A single comparable property."""
     address: str = ""
     price: float = 0.0
@@ -182,9 +189,101 @@ class InvestmentStrategy:
 # Calculation Engine
 # ---------------------------------------------------------------------------
 
+PROJECTION_YEARS = 30
+
+# Letter grades by minimum score; _GRADE_LABELS[i] applies when score clears
+# exactly i cutoffs.
+_GRADE_CUTOFFS = (40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90, 95)
+_GRADE_LABELS = ("F", "D-", "D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+")
+
+
+def _discounted_sum(cash_flows: List[float], rate: float) -> float:
+    """Present value of cash_flows[t] at rate, evaluated in Horner form."""
+    inv = 1 / (1 + rate)
+    acc = 0.0
+    for cf in reversed(cash_flows):
+        acc = acc * inv + cf
+    return acc
+
+
+def _growth_ladder(rate: float, n: int, start: float) -> List[float]:
+    """[start, start*(1+rate), ...] of length n, built as a running product."""
+    factor = 1 + rate
+    ladder = []
+    g = start
+    for _ in range(n):
+        ladder.append(g)
+        g *= factor
+    return ladder
+
+
+def _memoized(method):
+    """Cache a no-argument method's result on the instance.
+
+    InvestmentCalculator inputs are fixed at construction, so these results
+    never go stale for the lifetime of the instance.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        try:
+            return self._cache[name]
+        except KeyError:
+            result = self._cache[name] = method(self)
+            return result
+
+    return wrapper
+
+
+def _clamp100(x: float) -> float:
+    """Clamp x to [0, 100]; NaN maps to 0 like min(100, max(0, x))."""
+    if 0.0 <= x <= 100.0:
+        return x
+    return 100.0 if x > 100.0 else 0.0
+
+
+def _weighted_score(parts: Tuple[Tuple[str, float, float], ...]) -> Tuple[Dict[str, float], float]:
+    """Clamp (label, score, weight) parts to 0-100 and fold them in one pass.
+
+    Returns the display components (rounded to 0.1) and the weighted total.
+    """
+    components = {}
+    total = 0.0
+    for label, score, weight in parts:
+        score = _clamp100(score)
+        components[label] = round(score, 1)
+        total += score * weight
+    return components, total
+
+
+def _round_floats(values: Dict[str, float], ndigits: int = 2) -> Dict[str, float]:
+    """Round every (numeric) value in values to a float with ndigits."""
+    return {k: round(float(v), ndigits) for k, v in values.items()}
+
+
 class InvestmentCalculator:
     """Institutional-grade investment calculations."""
 
+    # Every attribute is set once in __init__
+    __slots__ = (
+        # Inputs
+        "purchase_price", "estimated_rent", "loan_details", "amortization",
+        "vacancy_rate", "maintenance_pct", "management_fee_pct", "capex_reserve_pct",
+        "appreciation_rate", "rent_growth_rate", "expense_growth_rate",
+        "marginal_tax_rate", "hold_years",
+        # Derived
+        "loan_amount", "annual_debt_service", "down_payment", "upfront_costs",
+        "total_cash_invested", "interest_rate", "loan_term", "total_monthly_payment",
+        "_loan_calc", "_cache",
+        "property_tax_annual", "insurance_annual", "pmi_annual", "hoa_annual",
+        "maintenance_annual", "capex_reserve_annual",
+        "land_value", "depreciable_basis", "annual_depreciation",
+        "_amort_interest", "_amort_balance", "_opex_fixed_annual",
+        "_gross_y1", "_base_mgmt_y1", "_base_opex_no_mgmt",
+        "_growth_rent", "_growth_expense", "_growth_value",
+    )
+
     def __init__(
         self,
         purchase_price: float,
@@ -223,6 +322,9 @@ class InvestmentCalculator:
         self.total_cash_invested = self.down_payment + self.upfront_costs
         self.interest_rate = loan_details.get("interest_rate_decimal", 0.065)
         self.loan_term = loan_details.get("loan_term_years", 30)
+        self.total_monthly_payment = loan_details.get("total_monthly_payment", 0)
+        self._loan_calc = LoanCalculator()
+        self._cache: Dict[str, Any] = {}
 
         # Operating expense components (annual, year 1)
         self.property_tax_annual = loan_details.get("property_tax_annual", purchase_price * 0.015)
@@ -237,23 +339,45 @@ class InvestmentCalculator:
         self.depreciable_basis = purchase_price - self.land_value
         self.annual_depreciation = self.depreciable_basis / 27.5
 
+        # Amortization columns over the projection horizon, zero-padded past payoff
+        amort = amortization[:PROJECTION_YEARS]
+        pad = [0.0] * (PROJECTION_YEARS - len(amort))
+        self._amort_interest = [a["interest_paid"] for a in amort] + pad
+        self._amort_balance = [a["remaining_balance"] for a in amort] + pad
+
+        # Expenses that grow with inflation (PMI is fixed, management scales with rent)
+        self._opex_fixed_annual = (
+            self.property_tax_annual + self.insurance_annual + self.hoa_annual
+            + self.maintenance_annual + self.capex_reserve_annual
+        )
+
+        # Year-1 income/expense constants shared by every analysis
+        self._gross_y1 = estimated_rent * 12
+        self._base_mgmt_y1 = self._gross_y1 * management_fee_pct
+        # Summed in the original order (not _opex_fixed_annual + PMI) so the
+        # core metrics and stress tests don't change in the last bits
+        self._base_opex_no_mgmt = (
+            self.property_tax_annual + self.insurance_annual + self.pmi_annual
+            + self.hoa_annual + self.maintenance_annual + self.capex_reserve_annual
+        )
+
+        # Growth ladders over the projection horizon. Rent/expenses start at
+        # year-1 levels, property value compounds from year 1.
+        self._growth_rent = _growth_ladder(rent_growth_rate, PROJECTION_YEARS, 1.0)
+        self._growth_expense = _growth_ladder(expense_growth_rate, PROJECTION_YEARS, 1.0)
+        self._growth_value = _growth_ladder(
+            appreciation_rate, PROJECTION_YEARS, 1 + appreciation_rate
+        )
+
     # ----- Core Metrics -----
 
+    @_memoized
     def calculate_core_metrics(self) -> CoreMetrics:
-        gross_income = self.estimated_rent * 12
+        gross_income = self._gross_y1
         vacancy_loss = gross_income * self.vacancy_rate
         egi = gross_income - vacancy_loss
 
-        management_fee = gross_income * self.management_fee_pct
-        opex = (
-            self.property_tax_annual
-            + self.insurance_annual
-            + self.pmi_annual
-            + self.hoa_annual
-            + self.maintenance_annual
-            + self.capex_reserve_annual
-            + management_fee
-        )
+        opex = self._base_opex_no_mgmt + self._base_mgmt_y1
 
         noi = egi - opex
         cash_flow_bt = noi - self.annual_debt_service
@@ -271,107 +395,91 @@ class InvestmentCalculator:
         else:
             be_occ = 100.0
 
-        return CoreMetrics(
-            gross_rental_income=round(gross_income, 2),
-            vacancy_loss=round(vacancy_loss, 2),
-            effective_gross_income=round(egi, 2),
-            operating_expenses=round(opex, 2),
-            noi=round(noi, 2),
-            annual_debt_service=round(self.annual_debt_service, 2),
-            cash_flow_before_tax=round(cash_flow_bt, 2),
-            total_cash_invested=round(self.total_cash_invested, 2),
-            cash_on_cash_return=round(coc, 2),
-            cap_rate=round(cap_rate, 2),
-            gross_rental_yield=round(gross_yield, 2),
-            rent_to_value=round(rtv, 3),
-            dscr=round(dscr, 2),
-            opex_ratio=round(opex_ratio, 2),
-            break_even_occupancy=round(min(be_occ, 100), 2),
-            capex_reserve_annual=round(self.capex_reserve_annual, 2),
+        raw = {
+            "gross_rental_income": gross_income,
+            "vacancy_loss": vacancy_loss,
+            "effective_gross_income": egi,
+            "operating_expenses": opex,
+            "noi": noi,
+            "annual_debt_service": self.annual_debt_service,
+            "cash_flow_before_tax": cash_flow_bt,
+            "total_cash_invested": self.total_cash_invested,
+            "cash_on_cash_return": coc,
+            "cap_rate": cap_rate,
+            "gross_rental_yield": gross_yield,
+            "dscr": dscr,
+            "opex_ratio": opex_ratio,
+            "break_even_occupancy": min(be_occ, 100),
+            "capex_reserve_annual": self.capex_reserve_annual,
+        }
+        # Every field is a float computed above, so skip Pydantic validation
+        return CoreMetrics.model_construct(
+            **_round_floats(raw), rent_to_value=round(float(rtv), 3)
         )
 
     # ----- Multi-Year Projection -----
 
+    @_memoized
     def generate_multi_year_projection(self) -> MultiYearProjection:
-        years: List[YearProjection] = []
-        cash_flows = [-self.total_cash_invested]  # IRR cash flow series
-
-        cumulative_depreciation = 0.0
-
-        for yr in range(1, 31):
-            growth_factor_rent = (1 + self.rent_growth_rate) ** (yr - 1)
-            growth_factor_expense = (1 + self.expense_growth_rate) ** (yr - 1)
-            growth_factor_value = (1 + self.appreciation_rate) ** yr
-
-            gross_income = self.estimated_rent * 12 * growth_factor_rent
-            vac_loss = gross_income * self.vacancy_rate
-            egi = gross_income - vac_loss
-
-            management_fee = gross_income * self.management_fee_pct
-            opex = (
-                self.property_tax_annual * growth_factor_expense
-                + self.insurance_annual * growth_factor_expense
-                + self.pmi_annual  # PMI doesn't inflate
-                + self.hoa_annual * growth_factor_expense
-                + self.maintenance_annual * growth_factor_expense
-                + self.capex_reserve_annual * growth_factor_expense
-                + management_fee
-            )
-
-            noi = egi - opex
-            debt_service = self.annual_debt_service
-            cf_bt = noi - debt_service
-
-            # Tax analysis
-            depreciation = self.annual_depreciation
-            cumulative_depreciation += depreciation
-
-            # Get mortgage interest from amortization schedule
-            if yr <= len(self.amortization):
-                mortgage_interest = self.amortization[yr - 1]["interest_paid"]
-                loan_balance = self.amortization[yr - 1]["remaining_balance"]
-            else:
-                mortgage_interest = 0.0
-                loan_balance = 0.0
-
-            taxable_income = noi - depreciation - mortgage_interest
-            tax = taxable_income * self.marginal_tax_rate if taxable_income > 0 else 0
-            cf_at = cf_bt - tax
-
-            prop_value = self.purchase_price * growth_factor_value
-            equity = prop_value - loan_balance
-            roe = (cf_bt / equity * 100) if equity > 0 else 0
-
-            yp = YearProjection(
+        # Loop invariants
+        debt_service = float(self.annual_debt_service)
+        depreciation = self.annual_depreciation
+        tax_rate = self.marginal_tax_rate
+
+        # Column-wise derivation of every projected series
+        gross = [self._gross_y1 * g for g in self._growth_rent]
+        vac_loss = [g * self.vacancy_rate for g in gross]
+        egi = [g - v for g, v in zip(gross, vac_loss)]
+        opex = [
+            # PMI doesn't inflate
+            self._opex_fixed_annual * ge + self.pmi_annual + g * self.management_fee_pct
+            for g, ge in zip(gross, self._growth_expense)
+        ]
+        noi = [e - o for e, o in zip(egi, opex)]
+        cf_bt = [n - debt_service for n in noi]
+        taxable = [n - depreciation - i for n, i in zip(noi, self._amort_interest)]
+        tax = [t * tax_rate if t > 0 else 0.0 for t in taxable]
+        cf_at = [c - t for c, t in zip(cf_bt, tax)]
+        prop_value = [self.purchase_price * g for g in self._growth_value]
+        equity = [v - b for v, b in zip(prop_value, self._amort_balance)]
+        roe = [(c / e * 100) if e > 0 else 0.0 for c, e in zip(cf_bt, equity)]
+
+        # Constant columns are rounded once rather than per row
+        debt_service_r = round(debt_service, 2)
+        depreciation_r = round(depreciation, 2)
+
+        # Every column is computed here from floats we own, so rows are built
+        # with model_construct() to skip per-field validation.
+        years = [
+            YearProjection.model_construct(
                 year=yr,
-                gross_income=round(gross_income, 2),
-                vacancy_loss=round(vac_loss, 2),
-                effective_income=round(egi, 2),
-                operating_expenses=round(opex, 2),
-                noi=round(noi, 2),
-                debt_service=round(debt_service, 2),
-                cash_flow_before_tax=round(cf_bt, 2),
-                depreciation=round(depreciation, 2),
-                mortgage_interest=round(mortgage_interest, 2),
-                taxable_income=round(taxable_income, 2),
-                tax_liability=round(tax, 2),
-                cash_flow_after_tax=round(cf_at, 2),
-                property_value=round(prop_value, 2),
-                loan_balance=round(loan_balance, 2),
-                equity=round(equity, 2),
-                return_on_equity=round(roe, 2),
+                gross_income=round(gross[i], 2),
+                vacancy_loss=round(vac_loss[i], 2),
+                effective_income=round(egi[i], 2),
+                operating_expenses=round(opex[i], 2),
+                noi=round(noi[i], 2),
+                debt_service=debt_service_r,
+                cash_flow_before_tax=round(cf_bt[i], 2),
+                depreciation=depreciation_r,
+                mortgage_interest=round(self._amort_interest[i], 2),
+                taxable_income=round(taxable[i], 2),
+                tax_liability=round(tax[i], 2),
+                cash_flow_after_tax=round(cf_at[i], 2),
+                property_value=round(prop_value[i], 2),
+                loan_balance=round(self._amort_balance[i], 2),
+                equity=round(equity[i], 2),
+                return_on_equity=round(roe[i], 2),
             )
-            years.append(yp)
+            for i, yr in enumerate(range(1, PROJECTION_YEARS + 1))
+        ]
 
-            # For IRR: annual after-tax cash flow (add terminal sale at hold_years)
-            if yr <= self.hold_years:
-                cash_flows.append(cf_at)
+        # For IRR: annual after-tax cash flow (add terminal sale at hold_years)
+        cash_flows = [-self.total_cash_invested] + cf_at[:max(self.hold_years, 0)]
 
         # Terminal sale at hold_years
         hold_yr = years[self.hold_years - 1] if self.hold_years <= len(years) else years[-1]
         terminal_sale_price = hold_yr.property_value
         selling_costs = terminal_sale_price * 0.06
-        dep_recapture_tax = cumulative_depreciation * 0.25 if self.hold_years <= 27 else (self.depreciable_basis * 0.25)
         # Only recapture up to hold_years of depreciation
         dep_recapture_tax = min(self.annual_depreciation * self.hold_years, self.depreciable_basis) * 0.25
         net_sale = terminal_sale_price - selling_costs - hold_yr.loan_balance - dep_recapture_tax
@@ -420,19 +528,47 @@ class InvestmentCalculator:
         if total_returned <= 0:
             return None
 
-        # Initial guess based on simple return
-        if total_invested > 0:
+        lo_clamp = -0.99
+        hi_clamp = 2.0  # Cap at 200% — anything higher is nonsensical
+
+        # Single payoff after the investment (e.g. a 1-year hold): closed form
+        n = len(cash_flows) - 1
+        if cash_flows[0] < 0 and not any(cash_flows[1:-1]):
+            r = (cash_flows[-1] / -cash_flows[0]) ** (1 / n) - 1
+            if lo_clamp < r < hi_clamp:
+                return r
+
+        # Initial guess: if NPV changes sign on [-0.5, 1.0], a few bisection
+        # rounds give Newton a start close to the root. Otherwise fall back to
+        # a guess based on simple return.
+        lo, hi = -0.5, 1.0
+        f_lo = _discounted_sum(cash_flows, lo)
+        if f_lo * _discounted_sum(cash_flows, hi) < 0:
+            for _ in range(10):
+                mid = 0.5 * (lo + hi)
+                f_mid = _discounted_sum(cash_flows, mid)
+                if f_lo * f_mid <= 0:
+                    hi = mid
+                else:
+                    lo, f_lo = mid, f_mid
+            r = 0.5 * (lo + hi)
+        elif total_invested > 0:
             simple_return = (total_returned - total_invested) / total_invested
             r = max(-0.5, min(simple_return / len(cash_flows), 0.5))
         else:
             r = 0.10
 
-        lo_clamp = -0.99
-        hi_clamp = 2.0  # Cap at 200% — anything higher is nonsensical
-
         for _ in range(max_iter):
-            npv = sum(cf / (1 + r) ** t for t, cf in enumerate(cash_flows))
-            dnpv = sum(-t * cf / (1 + r) ** (t + 1) for t, cf in enumerate(cash_flows))
+            # Single fused pass for NPV and dNPV/dr: the discount factor is a
+            # running product instead of two pow() calls per term.
+            factor = 1 + r
+            denom = 1.0
+            npv = cash_flows[0]
+            dnpv = 0.0
+            for t in range(1, len(cash_flows)):
+                denom *= factor
+                npv += cash_flows[t] / denom
+                dnpv -= t * cash_flows[t] / (denom * factor)
 
             if abs(dnpv) < 1e-12:
                 break
@@ -452,7 +588,7 @@ class InvestmentCalculator:
             r = r_new
 
         # Verify convergence: NPV at r should be near zero
-        npv_check = sum(cf / (1 + r) ** t for t, cf in enumerate(cash_flows))
+        npv_check = _discounted_sum(cash_flows, r)
         if abs(npv_check) < max(1.0, total_invested * 0.001):
             return r
         return None
@@ -463,12 +599,12 @@ class InvestmentCalculator:
     def calculate_npv(cash_flows: List[float], discount_rate: float = 0.08) -> Optional[float]:
         if not cash_flows:
             return None
-        return sum(cf / (1 + discount_rate) ** t for t, cf in enumerate(cash_flows))
+        return _discounted_sum(cash_flows, discount_rate)
 
     # ----- Tax Analysis (Year 1) -----
 
     def calculate_tax_analysis(self, core: CoreMetrics) -> TaxAnalysis:
-        interest_yr1 = self.amortization[0]["interest_paid"] if self.amortization else 0
+        interest_yr1 = self._amort_interest[0]
 
         taxable_income = core.noi - self.annual_depreciation - interest_yr1
         paper_loss = min(taxable_income, 0)
@@ -477,82 +613,67 @@ class InvestmentCalculator:
 
         cf_after_tax = core.cash_flow_before_tax - tax_owed + tax_savings
 
-        return TaxAnalysis(
-            annual_depreciation=round(self.annual_depreciation, 2),
-            depreciable_basis=round(self.depreciable_basis, 2),
-            mortgage_interest_year1=round(interest_yr1, 2),
-            noi=round(core.noi, 2),
-            taxable_income=round(taxable_income, 2),
-            paper_loss=round(paper_loss, 2),
-            tax_savings=round(tax_savings, 2),
-            effective_cash_flow_after_tax=round(cf_after_tax, 2),
+        return TaxAnalysis.model_construct(
+            **_round_floats({
+                "annual_depreciation": self.annual_depreciation,
+                "depreciable_basis": self.depreciable_basis,
+                "mortgage_interest_year1": interest_yr1,
+                "noi": core.noi,
+                "taxable_income": taxable_income,
+                "paper_loss": paper_loss,
+                "tax_savings": tax_savings,
+                "effective_cash_flow_after_tax": cf_after_tax,
+            }),
             marginal_tax_rate=self.marginal_tax_rate,
         )
 
     # ----- Stress Tests -----
 
     def run_stress_tests(self, core: CoreMetrics) -> RiskAnalysis:
-        scenarios: List[StressScenario] = []
-
-        base_gross = self.estimated_rent * 12
-        base_management = base_gross * self.management_fee_pct
-        base_opex_no_mgmt = (
-            self.property_tax_annual + self.insurance_annual + self.pmi_annual
-            + self.hoa_annual + self.maintenance_annual + self.capex_reserve_annual
+        vac = self.vacancy_rate
+        rate = self.interest_rate
+
+        # Only the rate shock changes debt service; price it once up front
+        base_ds = self.annual_debt_service
+        ds_rate_up = self._loan_calc.calculate_monthly_payment(
+            self.loan_amount, rate + 0.02, self.loan_term
+        ) * 12
+
+        # (name, description, vacancy, rent multiplier, expense multiplier, debt service)
+        scenario_params = (
+            ("Vacancy Doubles", f"Vacancy increases from {vac*100:.0f}% to {vac*200:.0f}%",
+             vac * 2, 1.0, 1.0, base_ds),
+            ("Rate +2%", f"Interest rate rises from {rate*100:.1f}% to {(rate+0.02)*100:.1f}%",
+             vac, 1.0, 1.0, ds_rate_up),
+            ("Rent -10%", "Rents decline 10%", vac, 0.90, 1.0, base_ds),
+            ("Rent -20%", "Rents decline 20%", vac, 0.80, 1.0, base_ds),
+            ("Expense Surge", "Operating expenses increase 50%", vac, 1.0, 1.50, base_ds),
+            ("Combined Downturn", "Vacancy +50%, rent -10%, expenses +20%",
+             vac * 1.5, 0.90, 1.20, base_ds),
         )
 
-        def calc_scenario(name: str, desc: str, vacancy: float, rent_mult: float,
-                          expense_mult: float, rate_add: float) -> StressScenario:
-            gross = base_gross * rent_mult
-            vac = gross * vacancy
-            egi = gross - vac
-            mgmt = gross * self.management_fee_pct
-            opex = base_opex_no_mgmt * expense_mult + mgmt
-
+        scenarios: List[StressScenario] = []
+        for name, desc, vacancy, rent_mult, expense_mult, ds in scenario_params:
+            gross = self._gross_y1 * rent_mult
+            egi = gross - gross * vacancy
+            opex = self._base_opex_no_mgmt * expense_mult + gross * self.management_fee_pct
             noi = egi - opex
 
-            # Recalculate debt service if rate changes
-            if rate_add > 0:
-                calc = LoanCalculator()
-                new_pmt = calc.calculate_monthly_payment(
-                    self.loan_amount, self.interest_rate + rate_add, self.loan_term
-                )
-                ds = new_pmt * 12
-            else:
-                ds = self.annual_debt_service
-
             cf = noi - ds
             dscr = noi / ds if ds > 0 else float('inf')
             coc = (cf / self.total_cash_invested * 100) if self.total_cash_invested > 0 else 0
 
-            return StressScenario(
+            scenarios.append(StressScenario(
                 name=name,
                 description=desc,
-                cash_flow_monthly=round(cf / 12, 2),
-                cash_flow_annual=round(cf, 2),
-                dscr=round(dscr, 2),
-                cash_on_cash=round(coc, 2),
                 passes=cf >= 0 and dscr >= 1.0,
-            )
-
-        scenarios.append(calc_scenario(
-            "Vacancy Doubles", f"Vacancy increases from {self.vacancy_rate*100:.0f}% to {self.vacancy_rate*200:.0f}%",
-            self.vacancy_rate * 2, 1.0, 1.0, 0.0))
-        scenarios.append(calc_scenario(
-            "Rate +2%", f"Interest rate rises from {self.interest_rate*100:.1f}% to {(self.interest_rate+0.02)*100:.1f}%",
-            self.vacancy_rate, 1.0, 1.0, 0.02))
-        scenarios.append(calc_scenario(
-            "Rent -10%", "Rents decline 10%",
-            self.vacancy_rate, 0.90, 1.0, 0.0))
-        scenarios.append(calc_scenario(
-            "Rent -20%", "Rents decline 20%",
-            self.vacancy_rate, 0.80, 1.0, 0.0))
-        scenarios.append(calc_scenario(
-            "Expense Surge", "Operating expenses increase 50%",
-            self.vacancy_rate, 1.0, 1.50, 0.0))
-        scenarios.append(calc_scenario(
-            "Combined Downturn", "Vacancy +50%, rent -10%, expenses +20%",
-            self.vacancy_rate * 1.5, 0.90, 1.20, 0.0))
+                **_round_floats({
+                    "cash_flow_monthly": cf / 12,
+                    "cash_flow_annual": cf,
+                    "dscr": dscr,
+                    "cash_on_cash": coc,
+                }),
+            ))
 
         # Break-even calculations
         be = self._calc_break_evens(core)
@@ -597,11 +718,10 @@ class InvestmentCalculator:
             max_price = 0
 
         # Max interest rate: find rate where NOI = DS
-        # Binary search
         max_rate = self._find_max_rate(core.noi)
 
         # Max vacancy: find vac where cash flow = 0
-        gross = self.estimated_rent * 12
+        gross = self._gross_y1
         if gross > 0:
             # NOI at vac v: gross*(1-v) - mgmt - opex_fixed
             # CF = NOI - DS = 0
@@ -614,31 +734,53 @@ class InvestmentCalculator:
         else:
             max_vac = 0
 
-        return BreakEvenMetrics(
-            min_monthly_rent=round(max(min_rent, 0), 2),
-            max_purchase_price=round(max(max_price, 0), 2),
-            max_interest_rate=round(max_rate * 100, 2),
-            max_vacancy_rate=round(max_vac * 100, 2),
-        )
+        return BreakEvenMetrics.model_construct(**_round_floats({
+            "min_monthly_rent": max(min_rent, 0),
+            "max_purchase_price": max(max_price, 0),
+            "max_interest_rate": max_rate * 100,
+            "max_vacancy_rate": max_vac * 100,
+        }))
 
     def _find_max_rate(self, noi: float) -> float:
-        """Binary search for max interest rate where NOI covers debt service."""
+        """Max interest rate where NOI covers debt service (safeguarded Newton)."""
         if noi <= 0 or self.loan_amount <= 0:
             return 0.0
 
-        calc = LoanCalculator()
-        lo, hi = 0.001, 0.25  # ~0% to 25%
+        loan = self.loan_amount
+        n = self.loan_term * 12
+
+        def ds_gap(rate: float) -> Tuple[float, float]:
+            # Annual debt service minus NOI, and its derivative w.r.t. the annual rate
+            m = rate / 12
+            q = (1 + m) ** n
+            pmt = loan * m * q / (q - 1)
+            dpmt = loan * q / (q - 1) - loan * m * n * q / ((1 + m) * (q - 1) ** 2)
+            return pmt * 12 - noi, dpmt
 
+        lo, hi = 0.001, 0.25  # ~0% to 25%
+        if ds_gap(lo)[0] >= 0:
+            return lo
+        f_hi, _ = ds_gap(hi)
+        if f_hi < 0:
+            return hi
+
+        # Debt service is increasing and convex in rate, so Newton from the
+        # upper end converges monotonically; bisect if a step leaves the bracket.
+        r = hi
         for _ in range(50):
-            mid = (lo + hi) / 2
-            pmt = calc.calculate_monthly_payment(self.loan_amount, mid, self.loan_term)
-            ds = pmt * 12
-            if ds < noi:
-                lo = mid
+            f, df = ds_gap(r)
+            if f < 0:
+                lo = r
             else:
-                hi = mid
+                hi = r
+            r_new = r - f / df if df > 0 else lo
+            if not lo < r_new < hi:
+                r_new = (lo + hi) / 2
+            if abs(r_new - r) < 1e-12:
+                return r_new
+            r = r_new
 
-        return lo
+        return r
 
     # ----- Comparable Analysis -----
 
@@ -656,57 +798,60 @@ class InvestmentCalculator:
         sqft_min = int(sqft * 0.7) if sqft else None
         sqft_max = int(sqft * 1.3) if sqft else None
 
-        # Fetch sale comps
-        try:
-            sale_data = await rentcast_client.get_sale_listings(
+        # Fetch sale and rental comps concurrently; either may fail independently
+        sale_data, rental_data = await asyncio.gather(
+            rentcast_client.get_sale_listings(
                 zip_code=zip_code, bedrooms=bedrooms, bathrooms=bathrooms,
                 sqft_min=sqft_min, sqft_max=sqft_max, property_type=property_type, limit=10,
-            )
-            for item in sale_data:
-                price = item.get("price", 0)
-                sf = item.get("squareFootage", 0) or item.get("sqft", 0)
-                if price and sf:
-                    result.sale_comps.append(CompProperty(
-                        address=item.get("formattedAddress", item.get("address", "")),
-                        price=price,
-                        sqft=sf,
-                        price_per_sqft=round(price / sf, 2),
-                        bedrooms=item.get("bedrooms"),
-                        bathrooms=item.get("bathrooms"),
-                    ))
-        except Exception:
-            pass
-
-        # Fetch rental comps
-        try:
-            rental_data = await rentcast_client.get_rental_listings(
+            ),
+            rentcast_client.get_rental_listings(
                 zip_code=zip_code, bedrooms=bedrooms, bathrooms=bathrooms,
                 sqft_min=sqft_min, sqft_max=sqft_max, property_type=property_type, limit=10,
-            )
-            for item in rental_data:
-                price = item.get("price", 0) or item.get("rent", 0)
-                sf = item.get("squareFootage", 0) or item.get("sqft", 0)
-                if price and sf:
-                    result.rental_comps.append(CompProperty(
-                        address=item.get("formattedAddress", item.get("address", "")),
-                        price=price,
-                        sqft=sf,
-                        price_per_sqft=round(price / sf, 2),
-                        bedrooms=item.get("bedrooms"),
-                        bathrooms=item.get("bathrooms"),
-                    ))
-        except Exception:
-            pass
+            ),
+            return_exceptions=True,
+        )
+
+        if not isinstance(sale_data, BaseException):
+            try:
+                for item in sale_data:
+                    price = item.get("price", 0)
+                    sf = item.get("squareFootage", 0) or item.get("sqft", 0)
+                    if price and sf:
+                        result.sale_comps.append(CompProperty(
+                            address=item.get("formattedAddress", item.get("address", "")),
+                            price=float(price),
+                            sqft=float(sf),
+                            price_per_sqft=round(price / sf, 2),
+                            bedrooms=item.get("bedrooms"),
+                            bathrooms=item.get("bathrooms"),
+                        ))
+            except Exception:
+                pass
+
+        if not isinstance(rental_data, BaseException):
+            try:
+                for item in rental_data:
+                    price = item.get("price", 0) or item.get("rent", 0)
+                    sf = item.get("squareFootage", 0) or item.get("sqft", 0)
+                    if price and sf:
+                        result.rental_comps.append(CompProperty(
+                            address=item.get("formattedAddress", item.get("address", "")),
+                            price=float(price),
+                            sqft=float(sf),
+                            price_per_sqft=round(price / sf, 2),
+                            bedrooms=item.get("bedrooms"),
+                            bathrooms=item.get("bathrooms"),
+                        ))
+            except Exception:
+                pass
 
         # Compute medians
         if result.sale_comps:
-            result.median_sale_price_sqft = round(
-                statistics.median(c.price_per_sqft for c in result.sale_comps), 2
-            )
+            sale_ppsf = [c.price_per_sqft for c in result.sale_comps]
+            result.median_sale_price_sqft = round(statistics.median(sale_ppsf), 2)
         if result.rental_comps:
-            result.median_rent_sqft = round(
-                statistics.median(c.price_per_sqft for c in result.rental_comps), 2
-            )
+            rent_ppsf = [c.price_per_sqft for c in result.rental_comps]
+            result.median_rent_sqft = round(statistics.median(rent_ppsf), 2)
 
         # Subject property comparison
         if sqft and sqft > 0:
@@ -733,6 +878,28 @@ class InvestmentCalculator:
 
         return result
 
+    # ----- Full Run -----
+
+    @_memoized
+    def run_all_analyses(self) -> Tuple[
+        CoreMetrics, MultiYearProjection, TaxAnalysis, RiskAnalysis,
+        List[StrategyScore], Optional[StrategyScore], List[str],
+    ]:
+        """Run every local (non-network) analysis in dependency order.
+
+        Returns (core, projection, tax, risk, strategy_scores, best_strategy, summary).
+        """
+        core = self.calculate_core_metrics()
+        projection = self.generate_multi_year_projection()
+        tax = self.calculate_tax_analysis(core)
+        risk = self.run_stress_tests(core)
+
+        strategy_scores = self.score_all_strategies(core, projection, risk)
+        best_strategy = max(strategy_scores, key=lambda s: s.score) if strategy_scores else None
+
+        summary = self.generate_executive_summary(core, projection, tax, risk, best_strategy)
+        return core, projection, tax, risk, strategy_scores, best_strategy, summary
+
     # ----- Score All Strategies -----
 
     def score_all_strategies(
@@ -751,52 +918,20 @@ class InvestmentCalculator:
 
     @staticmethod
     def _to_grade(score: float) -> str:
-        if score >= 95:
-            return "A+"
-        elif score >= 90:
-            return "A"
-        elif score >= 85:
-            return "A-"
-        elif score >= 80:
-            return "B+"
-        elif score >= 75:
-            return "B"
-        elif score >= 70:
-            return "B-"
-        elif score >= 65:
-            return "C+"
-        elif score >= 60:
-            return "C"
-        elif score >= 55:
-            return "C-"
-        elif score >= 50:
-            return "D+"
-        elif score >= 45:
-            return "D"
-        elif score >= 40:
-            return "D-"
-        else:
+        if math.isnan(score):
             return "F"
+        return _GRADE_LABELS[bisect.bisect_right(_GRADE_CUTOFFS, score)]
 
     def _score_rental(self, core: CoreMetrics, proj: MultiYearProjection, risk: RiskAnalysis) -> StrategyScore:
         # CoC 25%, Cap Rate 20%, DSCR 20%, Cash Flow 15%, IRR 10%, Risk 10%
-        coc_score = min(100, max(0, core.cash_on_cash_return / 8 * 100))  # 8% = 100
-        cap_score = min(100, max(0, core.cap_rate / 6 * 100))  # 6% = 100
-        dscr_score = min(100, max(0, (core.dscr - 0.5) / 1.0 * 100))  # 1.5 = 100
-        cf_score = min(100, max(0, core.cash_flow_before_tax / 12 / 200 * 100))  # $200/mo = 100
-        irr_score = min(100, max(0, (proj.irr or 0) / 15 * 100))  # 15% = 100
-        risk_score = max(0, 100 - risk.overall_risk_score)
-
-        components = {
-            "Cash-on-Cash": round(coc_score, 1),
-            "Cap Rate": round(cap_score, 1),
-            "DSCR": round(dscr_score, 1),
-            "Cash Flow": round(cf_score, 1),
-            "IRR": round(irr_score, 1),
-            "Risk": round(risk_score, 1),
-        }
-        total = (coc_score * 0.25 + cap_score * 0.20 + dscr_score * 0.20
-                 + cf_score * 0.15 + irr_score * 0.10 + risk_score * 0.10)
+        components, total = _weighted_score((
+            ("Cash-on-Cash", core.cash_on_cash_return / 8 * 100, 0.25),  # 8% = 100
+            ("Cap Rate", core.cap_rate / 6 * 100, 0.20),  # 6% = 100
+            ("DSCR", (core.dscr - 0.5) * 100, 0.20),  # 1.5 = 100
+            ("Cash Flow", core.cash_flow_before_tax / 12 / 200 * 100, 0.15),  # $200/mo = 100
+            ("IRR", (proj.irr or 0) / 15 * 100, 0.10),  # 15% = 100
+            ("Risk", 100 - risk.overall_risk_score, 0.10),
+        ))
 
         pros, cons = [], []
         if core.cash_on_cash_return >= 8:
@@ -827,11 +962,10 @@ class InvestmentCalculator:
         profit = arv_estimate - self.purchase_price
         margin = (profit / self.purchase_price * 100) if self.purchase_price > 0 else 0
 
-        margin_score = min(100, max(0, margin / 20 * 100))  # 20% margin = 100
-        roi_score = min(100, max(0, margin / 15 * 100))  # annualized
-
-        components = {"Profit Margin": round(margin_score, 1), "ROI": round(roi_score, 1)}
-        total = margin_score * 0.6 + roi_score * 0.4
+        components, total = _weighted_score((
+            ("Profit Margin", margin / 20 * 100, 0.6),  # 20% margin = 100
+            ("ROI", margin / 15 * 100, 0.4),  # annualized
+        ))
 
         pros, cons = [], []
         if margin >= 15:
@@ -856,16 +990,11 @@ class InvestmentCalculator:
         equity_extraction = refi_loan - self.loan_amount
         extraction_pct = (equity_extraction / self.total_cash_invested * 100) if self.total_cash_invested > 0 else 0
 
-        rental_score = min(100, max(0, core.cash_on_cash_return / 10 * 100))  # 10% = 100
-        extraction_score = min(100, max(0, extraction_pct / 100 * 100))  # 100% extraction = 100
-        dscr_score = min(100, max(0, (core.dscr - 0.5) / 1.0 * 100))
-
-        components = {
-            "Rental Return": round(rental_score, 1),
-            "Equity Extraction": round(extraction_score, 1),
-            "DSCR": round(dscr_score, 1),
-        }
-        total = rental_score * 0.4 + extraction_score * 0.35 + dscr_score * 0.25
+        components, total = _weighted_score((
+            ("Rental Return", core.cash_on_cash_return / 10 * 100, 0.4),  # 10% = 100
+            ("Equity Extraction", extraction_pct, 0.35),  # 100% extraction = 100
+            ("DSCR", (core.dscr - 0.5) * 100, 0.25),
+        ))
 
         pros, cons = [], []
         if extraction_pct >= 70:
@@ -888,18 +1017,17 @@ class InvestmentCalculator:
 
     def _score_house_hack(self, core: CoreMetrics) -> StrategyScore:
         # Rental coverage %, personal housing cost reduction
-        total_payment = self.loan_details.get("total_monthly_payment", 0)
+        total_payment = self.total_monthly_payment
         rental_coverage = (self.estimated_rent / total_payment * 100) if total_payment > 0 else 0
 
         # Assume renting half the units: coverage / 2 covers your half
         personal_cost = total_payment - self.estimated_rent * 0.5  # if renting half
         cost_reduction = ((total_payment - personal_cost) / total_payment * 100) if total_payment > 0 else 0
 
-        coverage_score = min(100, max(0, rental_coverage / 100 * 100))  # 100% coverage = 100
-        cost_score = min(100, max(0, cost_reduction / 50 * 100))  # 50% reduction = 100
-
-        components = {"Rental Coverage": round(coverage_score, 1), "Cost Reduction": round(cost_score, 1)}
-        total = coverage_score * 0.6 + cost_score * 0.4
+        components, total = _weighted_score((
+            ("Rental Coverage", rental_coverage, 0.6),  # 100% coverage = 100
+            ("Cost Reduction", cost_reduction / 50 * 100, 0.4),  # 50% reduction = 100
+        ))
 
         pros, cons = [], []
         if rental_coverage >= 75:
@@ -925,23 +1053,19 @@ class InvestmentCalculator:
     def _score_long_term(self, core: CoreMetrics, proj: MultiYearProjection, risk: RiskAnalysis) -> StrategyScore:
         # 10-year IRR, net equity (equity minus cumulative losses), appreciation, risk
         irr_10 = proj.irr or 0
-        irr_score = min(100, max(0, irr_10 / 12 * 100))  # 12% = 100
 
         # Net equity: equity at year 10 minus cumulative cash losses
-        yr10 = proj.years[9] if len(proj.years) >= 10 else (proj.years[-1] if proj.years else None)
+        first_10 = proj.years[:10]
+        yr10 = first_10[-1] if first_10 else None  # year 10, or the last year if shorter
         if yr10 and self.total_cash_invested > 0:
-            cumulative_cf = sum(y.cash_flow_before_tax for y in proj.years[:10])
+            cumulative_cf = sum([y.cash_flow_before_tax for y in first_10])
             net_equity = yr10.equity + cumulative_cf  # cumulative_cf is negative when losing money
             equity_mult = net_equity / self.total_cash_invested
-            equity_score = min(100, max(0, equity_mult / 5 * 100))  # 5x = 100
         else:
-            equity_score = 0
+            equity_mult = 0
             cumulative_cf = 0
             net_equity = 0
 
-        app_score = min(100, max(0, self.appreciation_rate / 0.05 * 100))  # 5% = 100
-        risk_score = max(0, 100 - risk.overall_risk_score)
-
         # Cash flow penalty: if losing money every year, cap overall score
         cf_penalty = 1.0
         if core.cash_flow_before_tax < 0:
@@ -949,13 +1073,12 @@ class InvestmentCalculator:
             annual_loss_ratio = abs(core.cash_flow_before_tax) / max(self.total_cash_invested, 1)
             cf_penalty = max(0.1, 1.0 - annual_loss_ratio)
 
-        components = {
-            "10Y IRR": round(irr_score, 1),
-            "Net Equity": round(equity_score, 1),
-            "Appreciation": round(app_score, 1),
-            "Risk": round(risk_score, 1),
-        }
-        raw_total = irr_score * 0.35 + equity_score * 0.30 + app_score * 0.20 + risk_score * 0.15
+        components, raw_total = _weighted_score((
+            ("10Y IRR", irr_10 / 12 * 100, 0.35),  # 12% = 100
+            ("Net Equity", equity_mult / 5 * 100, 0.30),  # 5x = 100
+            ("Appreciation", self.appreciation_rate / 0.05 * 100, 0.20),  # 5% = 100
+            ("Risk", 100 - risk.overall_risk_score, 0.15),
+        ))
         total = raw_total * cf_penalty
 
         pros, cons = [], []
@@ -995,63 +1118,156 @@ class InvestmentCalculator:
         risk: RiskAnalysis,
         best: Optional[StrategyScore],
     ) -> List[str]:
-        summary = []
-
-        # Best strategy
-        if best:
-            summary.append(
-                f"Best strategy: {best.strategy.replace('_', ' ').title()} "
-                f"(Score: {best.score}/100, Grade: {best.grade})"
-            )
-
-        # Cash flow
         monthly_cf = core.cash_flow_before_tax / 12
-        if monthly_cf >= 0:
-            summary.append(f"Positive monthly cash flow of ${monthly_cf:,.0f} before tax")
-        else:
-            summary.append(f"Negative monthly cash flow of ${monthly_cf:,.0f} - property requires subsidy")
-
-        # IRR
-        if projection.irr is not None:
-            summary.append(
-                f"Projected {self.hold_years}-year IRR of {projection.irr:.1f}% "
-                f"with ${projection.net_sale_proceeds:,.0f} net sale proceeds"
-            )
-
-        # Tax benefit
-        if tax.paper_loss < 0:
-            summary.append(f"Tax shelter: ${abs(tax.paper_loss):,.0f} paper loss generates ${tax.tax_savings:,.0f} in tax savings (Year 1)")
-        else:
-            summary.append(f"Taxable income of ${tax.taxable_income:,.0f} in Year 1")
-
-        # Risk
+        cap_rate = core.cap_rate
         passing = sum(1 for s in risk.scenarios if s.passes)
-        total = len(risk.scenarios)
-        summary.append(f"Risk: passes {passing}/{total} stress tests")
 
         # Cap rate context
-        if core.cap_rate >= 6:
-            summary.append(f"Cap rate of {core.cap_rate:.1f}% indicates solid income relative to price")
-        elif core.cap_rate >= 4:
-            summary.append(f"Cap rate of {core.cap_rate:.1f}% is moderate - typical for stable markets")
+        if cap_rate >= 6:
+            cap_note = f"Cap rate of {cap_rate:.1f}% indicates solid income relative to price"
+        elif cap_rate >= 4:
+            cap_note = f"Cap rate of {cap_rate:.1f}% is moderate - typical for stable markets"
         else:
-            summary.append(f"Cap rate of {core.cap_rate:.1f}% is low - may be an appreciation play")
+            cap_note = f"Cap rate of {cap_rate:.1f}% is low - may be an appreciation play"
 
-        return summary
+        summary = [
+            # Best strategy
+            (
+                f"Best strategy: {best.strategy.replace('_', ' ').title()} "
+                f"(Score: {best.score}/100, Grade: {best.grade})"
+            ) if best else None,
+            # Cash flow
+            f"Positive monthly cash flow of ${monthly_cf:,.0f} before tax" if monthly_cf >= 0
+            else f"Negative monthly cash flow of ${monthly_cf:,.0f} - property requires subsidy",
+            # IRR
+            (
+                f"Projected {self.hold_years}-year IRR of {projection.irr:.1f}% "
+                f"with ${projection.net_sale_proceeds:,.0f} net sale proceeds"
+            ) if projection.irr is not None else None,
+            # Tax benefit
+            f"Tax shelter: ${abs(tax.paper_loss):,.0f} paper loss generates ${tax.tax_savings:,.0f} in tax savings (Year 1)"
+            if tax.paper_loss < 0
+            else f"Taxable income of ${tax.taxable_income:,.0f} in Year 1",
+            # Risk
+            f"Risk: passes {passing}/{len(risk.scenarios)} stress tests",
+            cap_note,
+        ]
+        return [line for line in summary if line is not None]
 
 
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
 
+_ZIP_RE = re.compile(r'\b\d{5}\b')
+
+
+def _first_truthy(data: Dict[str, Any], keys: Tuple[str, ...], default: Any = None) -> Any:
+    """First truthy data[key] in key order (like chained `or`), else default."""
+    get = data.get
+    for key in keys:
+        value = get(key)
+        if value:
+            return value
+    return default
+
+
+@functools.lru_cache(maxsize=512, typed=True)
+def _build_calculator(
+    loan_calculator: LoanCalculator,
+    *,
+    purchase_price: float,
+    estimated_rent: float,
+    loan_type: str,
+    down_payment_pct: Optional[float],
+    interest_rate: float,
+    loan_term_years: int,
+    property_tax_annual: Optional[float],
+    insurance_annual: Optional[float],
+    hoa_monthly: float,
+    maintenance_pct: float,
+    vacancy_rate: float,
+    management_fee_pct: float,
+    appreciation_rate: float,
+    rent_growth_rate: float,
+    expense_growth_rate: float,
+    marginal_tax_rate: float,
+    hold_years: int,
+    capex_reserve_pct: float,
+) -> InvestmentCalculator:
+    """Loan details, amortization and calculator for one set of inputs.
+
+    Every analysis is a pure function of these inputs and the calculator
+    memoizes its own results, so re-analyzing with identical parameters
+    (e.g. a slider moved and then put back) skips the numeric work. Treat
+    the returned calculator and its results as read-only.
+    """
+    loan_details = loan_calculator.calculate_loan_details(
+        purchase_price=purchase_price,
+        loan_type=loan_type,
+        down_payment_pct=down_payment_pct,
+        interest_rate=interest_rate,
+        loan_term_years=loan_term_years,
+        property_tax_annual=property_tax_annual,
+        insurance_annual=insurance_annual,
+        hoa_monthly=hoa_monthly,
+    )
+
+    amortization = loan_calculator.generate_amortization_schedule(
+        loan_amount=loan_details["loan_amount"],
+        annual_rate=interest_rate,
+        years=loan_term_years,
+    )
+
+    return InvestmentCalculator(
+        purchase_price=purchase_price,
+        estimated_rent=estimated_rent,
+        loan_details=loan_details,
+        amortization=amortization,
+        vacancy_rate=vacancy_rate,
+        maintenance_pct=maintenance_pct,
+        management_fee_pct=management_fee_pct,
+        capex_reserve_pct=capex_reserve_pct,
+        appreciation_rate=appreciation_rate,
+        rent_growth_rate=rent_growth_rate,
+        expense_growth_rate=expense_growth_rate,
+        marginal_tax_rate=marginal_tax_rate,
+        hold_years=hold_years,
+    )
+
+
 class PropertyAnalyzer:
     """Orchestrates full property analysis. Same interface: URL in, dict out."""
 
-    def __init__(self):
-        self.loan_calculator = LoanCalculator()
-        self.rentcast_client = RentCastClient()
+    # Shared by every analyzer, so per-request analyzers don't rebuild them
+    # (and calculators cached per loan calculator stay warm across requests)
+    _loan_calculator = LoanCalculator()
+    _rentcast_client = RentCastClient()
+
+    def __init__(
+        self,
+        loan_calculator: Optional[LoanCalculator] = None,
+        rentcast_client: Optional[RentCastClient] = None,
+    ):
+        self.loan_calculator = loan_calculator or self._loan_calculator
+        self.rentcast_client = rentcast_client or self._rentcast_client
+
+    @classmethod
+    async def close_shared_clients(cls) -> None:
+        """Close the shared RentCast client's pooled connections."""
+        await cls._rentcast_client.aclose()
+
+    async def analyze_property(self, *args, **kwargs) -> Dict:
+        """Run the whole analysis and return it as a single dict.
+
+        Takes the same arguments as analyze_property_stream and merges its sections.
+        """
+        result: Dict[str, Any] = {}
+        async for section in self.analyze_property_stream(*args, **kwargs):
+            result.update(section)
+        return result
 
-    async def analyze_property(
+    async def analyze_property_stream(
         self,
         property_url: str,
         strategy_type: str = InvestmentStrategy.RENTAL,
@@ -1074,15 +1290,25 @@ class PropertyAnalyzer:
         marginal_tax_rate: float = 0.22,
         hold_years: int = 10,
         capex_reserve_pct: float = 0.03,
-    ) -> Dict:
-        from .url_parser import PropertyURLParser
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Analyze a property, yielding result sections as they become ready.
 
-        parser = PropertyURLParser()
-        property_info = parser.parse_property_url(property_url)
+        Yields everything except the comparables as soon as the calculations
+        finish, then {"comparables": ...} once the comp listings arrive. A
+        failure yields a single {"error": ...} dict.
+        """
+        property_info = PropertyURLParser.parse_property_url(property_url)
 
         if not property_info:
-            return {"error": "Could not parse property URL",
-                    "suggestions": ["Ensure URL is from Zillow or Realtor.com"]}
+            yield {"error": "Could not parse property URL",
+                   "suggestions": ["Ensure URL is from Zillow or Realtor.com"]}
+            return
+
+        # Reject an unusable manual price before spending any API calls
+        if purchase_price is not None and purchase_price <= 0:
+            yield {"error": "Purchase price must be greater than zero",
+                   "suggestions": ["Provide a positive purchase price or leave it blank"]}
+            return
 
         address = property_info.get("address")
 
@@ -1094,15 +1320,32 @@ class PropertyAnalyzer:
         sqft: Optional[int] = None
         property_type: Optional[str] = None
 
+        # Market statistics only need a zip code, so start on the one in the
+        # address while the property search is in flight.
+        zip_match = _ZIP_RE.search(address) if address else None
+        address_zip = zip_match.group(0) if zip_match else None
+        if address_zip:
+            market_task = asyncio.create_task(self._fetch_market_stats(address_zip))
+        else:
+            market_task = None
+
         try:
             properties = await self.rentcast_client.search_properties_by_address(address, limit=1)
 
             if not properties:
-                valuation_data = await self.rentcast_client.get_property_valuation(address)
-                rent_data = await self.rentcast_client.get_rent_estimate(address)
+                # Either estimate may fail on its own; a price or rent passed
+                # in by the caller still lets the analysis go ahead.
+                valuation_data, rent_data = await asyncio.gather(
+                    self.rentcast_client.get_property_valuation(address),
+                    self.rentcast_client.get_rent_estimate(address),
+                    return_exceptions=True,
+                )
+                if isinstance(valuation_data, BaseException):
+                    valuation_data = {}
+                if isinstance(rent_data, BaseException):
+                    rent_data = {}
 
-                zip_match = re.search(r'\b\d{5}\b', address)
-                zip_code = zip_match.group(0) if zip_match else None
+                zip_code = address_zip
 
                 property_data = {
                     "address": address,
@@ -1112,33 +1355,39 @@ class PropertyAnalyzer:
                 }
             else:
                 property_data = properties[0]
-                zip_code = property_data.get("zipCode") or property_data.get("zip")
+                zip_code = _first_truthy(property_data, ("zipCode", "zip"))
                 bedrooms = property_data.get("bedrooms")
                 bathrooms = property_data.get("bathrooms")
-                sqft = property_data.get("squareFootage") or property_data.get("sqft")
+                sqft = _first_truthy(property_data, ("squareFootage", "sqft"))
                 property_type = property_data.get("propertyType")
 
             if purchase_price is None:
-                purchase_price = (
-                    property_data.get("price")
-                    or property_data.get("estimated_value")
-                    or property_data.get("lastSalePrice")
-                    or 0
+                purchase_price = _first_truthy(
+                    property_data, ("price", "estimated_value", "lastSalePrice"), 0
                 )
             if purchase_price == 0:
-                return {"error": "Could not determine property price",
-                        "suggestions": ["Provide purchase price manually"]}
+                yield {"error": "Could not determine property price",
+                       "suggestions": ["Provide purchase price manually"]}
+                return
+
+            # Re-target the market statistics if the search found another zip
+            if zip_code != address_zip:
+                if market_task:
+                    market_task.cancel()
+                market_task = (
+                    asyncio.create_task(self._fetch_market_stats(zip_code)) if zip_code else None
+                )
 
             if estimated_rent is None:
-                estimated_rent = (
-                    property_data.get("rent")
-                    or property_data.get("estimated_rent")
-                    or property_data.get("rentEstimate")
-                    or 0
+                estimated_rent = _first_truthy(
+                    property_data, ("rent", "estimated_rent", "rentEstimate"), 0
                 )
 
-            # If still no rent, call the rent estimate API
-            if not estimated_rent and address:
+            # If still no rent, use the estimate fetched above when the search
+            # was empty, or call the API with the search's property details
+            if not estimated_rent and not properties:
+                estimated_rent = property_data.get("estimated_rent") or 0
+            elif not estimated_rent and address:
                 try:
                     rent_data = await self.rentcast_client.get_rent_estimate(
                         address,
@@ -1151,21 +1400,21 @@ class PropertyAnalyzer:
                 except Exception:
                     pass
 
-            # Market statistics
-            market_stats = None
-            if zip_code:
-                try:
-                    market_stats = await self.rentcast_client.get_market_statistics(zip_code)
-                except Exception:
-                    pass
+            market_stats = await market_task if market_task else None
 
         except Exception as e:
-            return {"error": f"Error fetching property data: {str(e)}",
-                    "property_info": property_info}
-
-        # --- Loan calculation ---
-        loan_details = self.loan_calculator.calculate_loan_details(
+            yield {"error": f"Error fetching property data: {str(e)}",
+                   "property_info": property_info}
+            return
+        finally:
+            if market_task and not market_task.done():
+                market_task.cancel()
+
+        # --- Loan, amortization and calculator (cached per input set) ---
+        calc = _build_calculator(
+            self.loan_calculator,
             purchase_price=purchase_price,
+            estimated_rent=estimated_rent or 0,
             loan_type=loan_type,
             down_payment_pct=down_payment_pct,
             interest_rate=interest_rate,
@@ -1173,69 +1422,71 @@ class PropertyAnalyzer:
             property_tax_annual=property_tax_annual,
             insurance_annual=insurance_annual,
             hoa_monthly=hoa_monthly,
-        )
-
-        # --- Amortization ---
-        amortization = self.loan_calculator.generate_amortization_schedule(
-            loan_amount=loan_details["loan_amount"],
-            annual_rate=interest_rate,
-            years=loan_term_years,
-        )
-
-        # --- Build calculator ---
-        calc = InvestmentCalculator(
-            purchase_price=purchase_price,
-            estimated_rent=estimated_rent or 0,
-            loan_details=loan_details,
-            amortization=amortization,
-            vacancy_rate=vacancy_rate,
             maintenance_pct=maintenance_pct,
+            vacancy_rate=vacancy_rate,
             management_fee_pct=management_fee_pct,
-            capex_reserve_pct=capex_reserve_pct,
             appreciation_rate=appreciation_rate,
             rent_growth_rate=rent_growth_rate,
             expense_growth_rate=expense_growth_rate,
             marginal_tax_rate=marginal_tax_rate,
             hold_years=hold_years,
+            capex_reserve_pct=capex_reserve_pct,
         )
+        loan_details = calc.loan_details
 
         # --- Run all analyses ---
-        core = calc.calculate_core_metrics()
-        projection = calc.generate_multi_year_projection()
-        tax = calc.calculate_tax_analysis(core)
-        risk = calc.run_stress_tests(core)
+        # The calculations are CPU-bound and don't depend on comps, so run
+        # them in a worker thread while the comps requests are in flight.
+        comps_task = asyncio.create_task(
+            self._fetch_comps(calc, zip_code, bedrooms, bathrooms, sqft, property_type)
+        )
+        try:
+            analyses = await asyncio.to_thread(calc.run_all_analyses)
+            core, projection, tax, risk, strategy_scores, best_strategy, summary = analyses
+
+            result = FullAnalysisResult(
+                property_info=property_info,
+                property_data=property_data,
+                market_statistics=market_stats,
+                loan_details=loan_details,
+                core_metrics=core,
+                projection=projection,
+                tax_analysis=tax,
+                risk_analysis=risk,
+                strategy_scores=strategy_scores,
+                best_strategy=best_strategy,
+                executive_summary=summary,
+                selected_strategy=strategy_type,
+            )
+            yield result.model_dump(exclude={"comparables"})
+
+            yield {"comparables": (await comps_task).model_dump()}
+        finally:
+            if not comps_task.done():
+                comps_task.cancel()
 
-        # Comps (graceful failure)
-        comps = ComparableAnalysis()
+    async def _fetch_market_stats(self, zip_code: str) -> Optional[Dict[str, Any]]:
+        """Market statistics for the zip code, or None on failure."""
+        try:
+            return await self.rentcast_client.get_market_statistics(zip_code)
+        except Exception:
+            return None
+
+    async def _fetch_comps(
+        self,
+        calc: InvestmentCalculator,
+        zip_code: Optional[str],
+        bedrooms: Optional[int],
+        bathrooms: Optional[float],
+        sqft: Optional[int],
+        property_type: Optional[str],
+    ) -> ComparableAnalysis:
+        """Comparable analysis for the zip code (graceful failure)."""
         if zip_code:
             try:
-                comps = await calc.build_comparable_analysis(
+                return await calc.build_comparable_analysis(
                     self.rentcast_client, zip_code, bedrooms, bathrooms, sqft, property_type,
                 )
             except Exception:
                 pass
-
-        # Score all strategies
-        strategy_scores = calc.score_all_strategies(core, projection, risk)
-        best_strategy = max(strategy_scores, key=lambda s: s.score) if strategy_scores else None
-
-        # Executive summary
-        summary = calc.generate_executive_summary(core, projection, tax, risk, best_strategy)
-
-        result = FullAnalysisResult(
-            property_info=property_info,
-            property_data=property_data,
-            market_statistics=market_stats,
-            loan_details=loan_details,
-            core_metrics=core,
-            projection=projection,
-            tax_analysis=tax,
-            risk_analysis=risk,
-            comparables=comps,
-            strategy_scores=strategy_scores,
-            best_strategy=best_strategy,
-            executive_summary=summary,
-            selected_strategy=strategy_type,
-        )
-
-        return result.model_dump()
+        return ComparableAnalysis()
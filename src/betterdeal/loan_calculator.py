@@ -4,8 +4,16 @@ Loan Calculator
 Calculates mortgage payments and costs for different loan types.
 """
 
+import functools
+from types import MappingProxyType
 from typing import Dict, List, Optional
-from decimal import Decimal, ROUND_HALF_UP
+
+
+@functools.lru_cache(maxsize=1024)
+def _amort_factor(monthly_rate: float, num_payments: int) -> float:
+    """Payment per unit of principal, r(1+r)^n / [(1+r)^n - 1]."""
+    growth = (1 + monthly_rate) ** num_payments
+    return (monthly_rate * growth) / (growth - 1)
 
 
 class LoanCalculator:
@@ -17,36 +25,47 @@ class LoanCalculator:
     VA = "va"
     USDA = "usda"
     
+    # Default loan parameters, shared read-only by every instance
+    LOAN_LIMITS = MappingProxyType({
+        CONVENTIONAL: MappingProxyType({
+            "min_down_payment_pct": 0.05,  # 5% minimum
+            "default_down_payment_pct": 0.20,  # 20% default
+            "pmi_rate_annual": 0.005,  # 0.5% annual PMI
+            "max_loan_amount": 766550,  # 2024 conforming loan limit
+        }),
+        FHA: MappingProxyType({
+            "min_down_payment_pct": 0.035,  # 3.5% minimum
+            "default_down_payment_pct": 0.035,
+            "mip_rate_annual": 0.0085,  # 0.85% annual MIP
+            "mip_upfront": 0.0175,  # 1.75% upfront MIP
+            "max_loan_amount": 498257,  # 2024 FHA limit (varies by area)
+        }),
+        VA: MappingProxyType({
+            "min_down_payment_pct": 0.0,  # 0% down payment
+            "default_down_payment_pct": 0.0,
+            "funding_fee_pct": 0.0215,  # 2.15% funding fee (varies)
+            "no_pmi": True,
+        }),
+        USDA: MappingProxyType({
+            "min_down_payment_pct": 0.0,  # 0% down payment
+            "default_down_payment_pct": 0.0,
+            "guarantee_fee_annual": 0.0035,  # 0.35% annual
+            "guarantee_fee_upfront": 0.01,  # 1% upfront
+            "max_income": None,  # Income limits apply
+        }),
+    })
+    
+    # Loan type -> (annual insurance, upfront fee) as (LOAN_LIMITS key, default rate):
+    # conventional PMI, FHA MIP, VA funding fee, USDA guarantee fees
+    INSURANCE_FEES = MappingProxyType({
+        CONVENTIONAL: (("pmi_rate_annual", 0.005), None),
+        FHA: (("mip_rate_annual", 0.0085), ("mip_upfront", 0.0175)),
+        VA: (None, ("funding_fee_pct", 0.0215)),
+        USDA: (("guarantee_fee_annual", 0.0035), ("guarantee_fee_upfront", 0.01)),
+    })
+    
     def __init__(self):
-        # Default loan parameters
-        self.loan_limits = {
-            self.CONVENTIONAL: {
-                "min_down_payment_pct": 0.05,  # 5% minimum
-                "default_down_payment_pct": 0.20,  # 20% default
-                "pmi_rate_annual": 0.005,  # 0.5% annual PMI
-                "max_loan_amount": 766550,  # 2024 conforming loan limit
-            },
-            self.FHA: {
-                "min_down_payment_pct": 0.035,  # 3.5% minimum
-                "default_down_payment_pct": 0.035,
-                "mip_rate_annual": 0.0085,  # 0.85% annual MIP
-                "mip_upfront": 0.0175,  # 1.75% upfront MIP
-                "max_loan_amount": 498257,  # 2024 FHA limit (varies by area)
-            },
-            self.VA: {
-                "min_down_payment_pct": 0.0,  # 0% down payment
-                "default_down_payment_pct": 0.0,
-                "funding_fee_pct": 0.0215,  # 2.15% funding fee (varies)
-                "no_pmi": True,
-            },
-            self.USDA: {
-                "min_down_payment_pct": 0.0,  # 0% down payment
-                "default_down_payment_pct": 0.0,
-                "guarantee_fee_annual": 0.0035,  # 0.35% annual
-                "guarantee_fee_upfront": 0.01,  # 1% upfront
-                "max_income": None,  # Income limits apply
-            },
-        }
+        self.loan_limits = self.LOAN_LIMITS
     
     def calculate_monthly_payment(
         self,
@@ -65,10 +84,7 @@ class LoanCalculator:
             return principal / num_payments
         
         # M = P * [r(1+r)^n] / [(1+r)^n - 1]
-        monthly_payment = principal * (
-            (monthly_rate * (1 + monthly_rate) ** num_payments) /
-            ((1 + monthly_rate) ** num_payments - 1)
-        )
+        monthly_payment = principal * _amort_factor(monthly_rate, num_payments)
         
         return round(monthly_payment, 2)
     
@@ -108,33 +124,19 @@ class LoanCalculator:
             loan_amount, interest_rate, loan_term_years
         )
         
-        # Calculate PMI/MIP if applicable
+        # Calculate PMI/MIP and upfront fees if applicable
         pmi_monthly = 0.0
         upfront_costs = 0.0
+        annual_fee, upfront_fee = self.INSURANCE_FEES.get(loan_type, (None, None))
+        
+        # PMI typically required on conventional loans when down payment < 20%
+        if annual_fee and (loan_type != self.CONVENTIONAL or down_payment_pct < 0.20):
+            key, default = annual_fee
+            pmi_monthly = loan_amount * loan_params.get(key, default) / 12.0
         
-        if loan_type == self.CONVENTIONAL and down_payment_pct < 0.20:
-            # PMI typically required when down payment < 20%
-            pmi_annual = loan_amount * loan_params.get("pmi_rate_annual", 0.005)
-            pmi_monthly = pmi_annual / 12.0
-        
-        elif loan_type == self.FHA:
-            # MIP (Mortgage Insurance Premium)
-            mip_annual = loan_amount * loan_params.get("mip_rate_annual", 0.0085)
-            pmi_monthly = mip_annual / 12.0
-            upfront_mip = loan_amount * loan_params.get("mip_upfront", 0.0175)
-            upfront_costs += upfront_mip
-        
-        elif loan_type == self.VA:
-            # VA funding fee
-            funding_fee = loan_amount * loan_params.get("funding_fee_pct", 0.0215)
-            upfront_costs += funding_fee
-        
-        elif loan_type == self.USDA:
-            # USDA guarantee fees
-            guarantee_annual = loan_amount * loan_params.get("guarantee_fee_annual", 0.0035)
-            pmi_monthly = guarantee_annual / 12.0
-            upfront_guarantee = loan_amount * loan_params.get("guarantee_fee_upfront", 0.01)
-            upfront_costs += upfront_guarantee
+        if upfront_fee:
+            key, default = upfront_fee
+            upfront_costs = loan_amount * loan_params.get(key, default)
         
         # Estimate property tax if not provided (typically 1-2% of value)
         if property_tax_annual is None:
@@ -215,12 +217,9 @@ class LoanCalculator:
             for _ in range(12):
                 if balance <= 0:
                     break
-                if monthly_rate == 0:
-                    interest_payment = 0.0
-                    principal_payment = monthly_payment
-                else:
-                    interest_payment = balance * monthly_rate
-                    principal_payment = monthly_payment - interest_payment
+                # At a 0% rate this is exactly 0.0 interest and a full principal payment
+                interest_payment = balance * monthly_rate
+                principal_payment = monthly_payment - interest_payment
 
                 # Handle final payment rounding
                 if principal_payment > balance:
@@ -4,17 +4,31 @@ RentCast API Client
 Reusable client for making RentCast API calls.
 """
 
+import asyncio
+import functools
 import os
+import time
 import httpx
-from typing import Dict, Any, List, Optional
-from dotenv import load_dotenv
+import orjson
+from typing import Dict, Any, List, Optional, Tuple
 
-load_dotenv()
+# Only read .env when the environment doesn't already provide the key
+if not os.getenv("RENTCAST_API_KEY"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 RENTCAST_API_KEY = os.getenv("RENTCAST_API_KEY")
 if not RENTCAST_API_KEY:
     raise ValueError("RENTCAST_API_KEY environment variable is required")
 
+# Responses are reused for this long (seconds); RentCast data changes slowly
+CACHE_TTL = 900.0
+CACHE_MAX_ENTRIES = 1024
+
+# Transient statuses worth retrying, and the longest Retry-After we'll wait
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_RETRY_AFTER = 5.0
+
 
 class RentCastClient:
     """Client for interacting with RentCast API."""
@@ -23,14 +37,104 @@ class RentCastClient:
         self.base_url = "https://api.rentcast.io/v1"
         self.headers = {"X-Api-Key": RENTCAST_API_KEY}
         self.timeout = 30.0
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._response_cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._in_flight: Dict[Tuple, asyncio.Task] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it for the running event loop.
+
+        Connections are bound to the loop that opened them, so a new client
+        is made if the loop has changed (e.g. across asyncio.run calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close pooled connections, if any are open."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+    
+    async def __aenter__(self) -> "RentCastClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def _cached_get(self, path: str, params: Dict[str, Any]) -> Any:
+        """GET path and return the decoded JSON, reusing fresh responses.
+
+        Responses are kept for CACHE_TTL seconds and concurrent requests for
+        the same path and params share one fetch. Cached values are shared
+        between callers, so treat them as read-only.
+        """
+        key = (path, tuple(sorted(params.items())))
+        hit = self._response_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < CACHE_TTL:
+            return hit[1]
+        
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._fetch(key, path, params))
+            task.add_done_callback(functools.partial(self._fetch_done, key))
+            self._in_flight[key] = task
+        # Shielded so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch(self, key: Tuple, path: str, params: Dict[str, Any]) -> Any:
+        response = await self._request_with_retry(path, params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        if len(self._response_cache) >= CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for k in [k for k, (t, _) in self._response_cache.items() if now - t >= CACHE_TTL]:
+                del self._response_cache[k]
+            if len(self._response_cache) >= CACHE_MAX_ENTRIES:
+                # Still full of fresh entries: drop the oldest
+                del self._response_cache[next(iter(self._response_cache))]
+        self._response_cache[key] = (time.monotonic(), data)
+        return data
     
-    async def get_http_client(self):
-        """Get or create HTTP client with proper headers."""
-        return httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers,
-            timeout=self.timeout
-        )
+    async def _request_with_retry(
+        self, path: str, params: Dict[str, Any], max_tries: int = 3
+    ) -> httpx.Response:
+        """GET path, retrying rate limits (429) and transient gateway errors.
+
+        Honors a numeric Retry-After (capped), otherwise backs off exponentially.
+        The last response is returned as-is for the caller to check.
+        """
+        for attempt in range(max_tries):
+            response = await self._get_client().get(path, params=params)
+            if response.status_code not in RETRY_STATUSES or attempt == max_tries - 1:
+                return response
+            
+            delay = 0.2 * 2 ** attempt
+            retry_after = response.headers.get("Retry-After")
+            if response.status_code == 429 and retry_after:
+                try:
+                    delay = min(max(float(retry_after), 0.0), MAX_RETRY_AFTER)
+                except ValueError:
+                    pass  # HTTP-date form; keep the backoff
+            await asyncio.sleep(delay)
+        return response
+    
+    def _fetch_done(self, key: Tuple, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every caller went away
     
     async def get_property_valuation(
         self,
@@ -42,22 +146,19 @@ class RentCastClient:
         comp_count: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Get property value estimate (AVM)."""
-        async with await self.get_http_client() as client:
-            params: Dict[str, Any] = {"address": address}
-            if property_type is not None:
-                params["propertyType"] = property_type
-            if bedrooms is not None:
-                params["bedrooms"] = bedrooms
-            if bathrooms is not None:
-                params["bathrooms"] = bathrooms
-            if square_footage is not None:
-                params["squareFootage"] = square_footage
-            if comp_count is not None:
-                params["compCount"] = comp_count
-            
-            response = await client.get("/avm/value", params=params)
-            response.raise_for_status()
-            return response.json()
+        params: Dict[str, Any] = {"address": address}
+        if property_type is not None:
+            params["propertyType"] = property_type
+        if bedrooms is not None:
+            params["bedrooms"] = bedrooms
+        if bathrooms is not None:
+            params["bathrooms"] = bathrooms
+        if square_footage is not None:
+            params["squareFootage"] = square_footage
+        if comp_count is not None:
+            params["compCount"] = comp_count
+        
+        return await self._cached_get("/avm/value", params)
     
     async def get_rent_estimate(
         self,
@@ -69,22 +170,19 @@ class RentCastClient:
         comp_count: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Get long-term rent estimate."""
-        async with await self.get_http_client() as client:
-            params: Dict[str, Any] = {"address": address}
-            if property_type is not None:
-                params["propertyType"] = property_type
-            if bedrooms is not None:
-                params["bedrooms"] = bedrooms
-            if bathrooms is not None:
-                params["bathrooms"] = bathrooms
-            if square_footage is not None:
-                params["squareFootage"] = square_footage
-            if comp_count is not None:
-                params["compCount"] = comp_count
-            
-            response = await client.get("/avm/rent/long-term", params=params)
-            response.raise_for_status()
-            return response.json()
+        params: Dict[str, Any] = {"address": address}
+        if property_type is not None:
+            params["propertyType"] = property_type
+        if bedrooms is not None:
+            params["bedrooms"] = bedrooms
+        if bathrooms is not None:
+            params["bathrooms"] = bathrooms
+        if square_footage is not None:
+            params["squareFootage"] = square_footage
+        if comp_count is not None:
+            params["compCount"] = comp_count
+        
+        return await self._cached_get("/avm/rent/long-term", params)
     
     async def get_market_statistics(
         self,
@@ -93,17 +191,13 @@ class RentCastClient:
         bedrooms: Optional[int] = None
     ) -> Dict[str, Any]:
         """Get market statistics for a ZIP code."""
-        async with await self.get_http_client() as client:
-            params = {
-                "zipCode": zip_code,
-                "propertyType": property_type,
-                "bedrooms": bedrooms
-            }
-            params = {k: v for k, v in params.items() if v is not None}
-            
-            response = await client.get("/markets", params=params)
-            response.raise_for_status()
-            return response.json()
+        params: Dict[str, Any] = {"zipCode": zip_code}
+        if property_type is not None:
+            params["propertyType"] = property_type
+        if bedrooms is not None:
+            params["bedrooms"] = bedrooms
+        
+        return await self._cached_get("/markets", params)
     
     async def search_properties_by_address(
         self,
@@ -111,21 +205,18 @@ class RentCastClient:
         limit: Optional[int] = 10
     ) -> List[Dict[str, Any]]:
         """Search for properties by address."""
-        async with await self.get_http_client() as client:
-            params = {"address": address}
-            if limit:
-                params["limit"] = limit
-
-            response = await client.get("/properties", params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict) and 'properties' in data:
-                return data['properties']
-            else:
-                return [data] if data else []
+        params = {"address": address}
+        if limit:
+            params["limit"] = limit
+
+        data = await self._cached_get("/properties", params)
+
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict) and 'properties' in data:
+            return data['properties']
+        else:
+            return [data] if data else []
 
     async def get_sale_listings(
         self,
@@ -138,23 +229,20 @@ class RentCastClient:
         limit: int = 10,
     ) -> List[Dict[str, Any]]:
         """Get active sale listings for comparable analysis."""
-        async with await self.get_http_client() as client:
-            params: Dict[str, Any] = {"zipCode": zip_code, "limit": limit}
-            if bedrooms is not None:
-                params["bedrooms"] = bedrooms
-            if bathrooms is not None:
-                params["bathrooms"] = bathrooms
-            if sqft_min is not None:
-                params["sqftMin"] = sqft_min
-            if sqft_max is not None:
-                params["sqftMax"] = sqft_max
-            if property_type is not None:
-                params["propertyType"] = property_type
-
-            response = await client.get("/listings/sale", params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data if isinstance(data, list) else []
+        params: Dict[str, Any] = {"zipCode": zip_code, "limit": limit}
+        if bedrooms is not None:
+            params["bedrooms"] = bedrooms
+        if bathrooms is not None:
+            params["bathrooms"] = bathrooms
+        if sqft_min is not None:
+            params["sqftMin"] = sqft_min
+        if sqft_max is not None:
+            params["sqftMax"] = sqft_max
+        if property_type is not None:
+            params["propertyType"] = property_type
+
+        data = await self._cached_get("/listings/sale", params)
+        return data if isinstance(data, list) else []
 
     async def get_rental_listings(
         self,
@@ -167,20 +255,17 @@ class RentCastClient:
         limit: int = 10,
     ) -> List[Dict[str, Any]]:
         """Get active rental listings for comparable analysis."""
-        async with await self.get_http_client() as client:
-            params: Dict[str, Any] = {"zipCode": zip_code, "limit": limit}
-            if bedrooms is not None:
-                params["bedrooms"] = bedrooms
-            if bathrooms is not None:
-                params["bathrooms"] = bathrooms
-            if sqft_min is not None:
-                params["sqftMin"] = sqft_min
-            if sqft_max is not None:
-                params["sqftMax"] = sqft_max
-            if property_type is not None:
-                params["propertyType"] = property_type
-
-            response = await client.get("/listings/rental", params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data if isinstance(data, list) else []
+        params: Dict[str, Any] = {"zipCode": zip_code, "limit": limit}
+        if bedrooms is not None:
+            params["bedrooms"] = bedrooms
+        if bathrooms is not None:
+            params["bathrooms"] = bathrooms
+        if sqft_min is not None:
+            params["sqftMin"] = sqft_min
+        if sqft_max is not None:
+            params["sqftMax"] = sqft_max
+        if property_type is not None:
+            params["propertyType"] = property_type
+
+        data = await self._cached_get("/listings/rental", params)
+        return data if isinstance(data, list) else []
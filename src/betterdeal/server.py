@@ -47,7 +47,6 @@ import logging
 import asyncio
 import json
 from typing import Dict, Any, List, Optional
-from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 import httpx
 
@@ -59,8 +58,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger("betterdeal")
 
-# Load environment variables
-load_dotenv()
+# Only read .env when the environment doesn't already provide the key
+if not os.getenv("RENTCAST_API_KEY"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Get API key from environment
 RENTCAST_API_KEY = os.getenv("RENTCAST_API_KEY")
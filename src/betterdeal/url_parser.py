@@ -4,37 +4,100 @@ URL Parser for Zillow and Realtor.com
 Extracts property information from listing URLs.
 """
 
+import asyncio
+import functools
+import logging
 import re
 from typing import Dict, Optional
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import ParseResult, urlparse, parse_qs
 import httpx
 
+logger = logging.getLogger(__name__)
+
+_ZILLOW_PATH = re.compile(r'/(?:homedetails|homes)/([^/]+)')
+_ZPID = re.compile(r'/(\d+)_zpid')
+_REALTOR_PATH = re.compile(r'/realestateandhomes-detail/([^/]+)')
+_REALTOR_ID_STRIP = re.compile(r'_M\d+_\d+$')
+_REALTOR_ID = re.compile(r'_M(\d+)_(\d+)$')
+
+# Address extraction from meta tags or structured data, tried in order
+_ADDRESS_PATTERNS = (
+    re.compile(r'"streetAddress":"([^"]+)"'),
+    re.compile(r'"address":"([^"]+)"'),
+    re.compile(r'property="streetAddress"[^>]*>([^<]+)'),
+)
+
+# Slug separators -> spaces, applied in a single pass
+_ZILLOW_TRANS = str.maketrans({'-': ' '})
+_REALTOR_TRANS = str.maketrans({'_': ' ', '-': ' '})
+
+_SCRAPE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+# Shared scraping client so repeat fetches reuse pooled connections
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared scraping client, creating it for the running event loop.
+
+    A client's connections are bound to the loop that opened them, so a new
+    one is made if the loop has changed (e.g. across asyncio.run calls).
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            headers=_SCRAPE_HEADERS,
+            timeout=10.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared scraping client, if one is open."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
+
 
 class PropertyURLParser:
     """Parser for extracting property data from listing URLs."""
     
     @staticmethod
-    def parse_zillow_url(url: str) -> Optional[Dict[str, str]]:
+    def parse_zillow_url(
+        url: str, parsed: Optional[ParseResult] = None
+    ) -> Optional[Dict[str, str]]:
         """
         Parse Zillow URL to extract property information.
         
         Zillow URLs typically look like:
         - https://www.zillow.com/homedetails/123-Main-St-City-ST-12345/12345678_zpid/
         - https://www.zillow.com/homes/123-Main-St-City-ST-12345_rb/
+
+        Pass `parsed` if the URL has already been split to avoid parsing it twice.
         """
         try:
-            parsed = urlparse(url)
+            parsed = parsed or urlparse(url)
             
             # Extract address from path
             # Pattern: /homedetails/ADDRESS/ID_zpid/ or /homes/ADDRESS_rb/
-            path_match = re.search(r'/(?:homedetails|homes)/([^/]+)', parsed.path)
+            path_match = _ZILLOW_PATH.search(parsed.path)
             if path_match:
                 address_slug = path_match.group(1)
                 # Convert slug to readable address (replace hyphens with spaces)
-                address = address_slug.replace('-', ' ').replace('_rb', '').replace('_zpid', '')
+                address_slug = address_slug.removesuffix('_rb').removesuffix('_zpid')
+                address = address_slug.translate(_ZILLOW_TRANS)
                 
                 # Extract ZPID if available
-                zpid_match = re.search(r'/(\d+)_zpid', parsed.path)
+                zpid_match = _ZPID.search(parsed.path)
                 zpid = zpid_match.group(1) if zpid_match else None
                 
                 return {
@@ -44,33 +107,37 @@ class PropertyURLParser:
                     "url": url
                 }
         except Exception as e:
-            print(f"Error parsing Zillow URL: {e}")
+            logger.warning("Error parsing Zillow URL: %s", e)
         
         return None
     
     @staticmethod
-    def parse_realtor_url(url: str) -> Optional[Dict[str, str]]:
+    def parse_realtor_url(
+        url: str, parsed: Optional[ParseResult] = None
+    ) -> Optional[Dict[str, str]]:
         """
         Parse Realtor.com URL to extract property information.
         
         Realtor.com URLs typically look like:
         - https://www.realtor.com/realestateandhomes-detail/123-Main-St_City_ST_12345_M12345_12345
+
+        Pass `parsed` if the URL has already been split to avoid parsing it twice.
         """
         try:
-            parsed = urlparse(url)
+            parsed = parsed or urlparse(url)
             
             # Extract address from path
             # Pattern: /realestateandhomes-detail/ADDRESS_ID
-            path_match = re.search(r'/realestateandhomes-detail/([^/]+)', parsed.path)
+            path_match = _REALTOR_PATH.search(parsed.path)
             if path_match:
                 address_slug = path_match.group(1)
                 # Remove trailing ID pattern (M12345_12345)
-                address_part = re.sub(r'_M\d+_\d+$', '', address_slug)
+                address_part = _REALTOR_ID_STRIP.sub('', address_slug)
                 # Convert slug to readable address
-                address = address_part.replace('_', ' ').replace('-', ' ')
+                address = address_part.translate(_REALTOR_TRANS)
                 
                 # Extract listing ID if available
-                id_match = re.search(r'_M(\d+)_(\d+)$', address_slug)
+                id_match = _REALTOR_ID.search(address_slug)
                 listing_id = f"M{id_match.group(1)}_{id_match.group(2)}" if id_match else None
                 
                 return {
@@ -80,7 +147,7 @@ class PropertyURLParser:
                     "url": url
                 }
         except Exception as e:
-            print(f"Error parsing Realtor URL: {e}")
+            logger.warning("Error parsing Realtor URL: %s", e)
         
         return None
     
@@ -91,28 +158,18 @@ class PropertyURLParser:
         This is a fallback if URL parsing doesn't provide enough info.
         """
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                if response.status_code == 200:
-                    html = response.text
-                    
-                    # Try to extract address from meta tags or structured data
-                    # This is a basic implementation - could be enhanced
-                    address_patterns = [
-                        r'"streetAddress":"([^"]+)"',
-                        r'"address":"([^"]+)"',
-                        r'property="streetAddress"[^>]*>([^<]+)',
-                    ]
-                    
-                    for pattern in address_patterns:
-                        match = re.search(pattern, html)
-                        if match:
-                            return {"address": match.group(1)}
+            response = await _get_http_client().get(url)
+            if response.status_code == 200:
+                html = response.text
+                
+                # Try to extract address from meta tags or structured data
+                # This is a basic implementation - could be enhanced
+                for pattern in _ADDRESS_PATTERNS:
+                    match = pattern.search(html)
+                    if match:
+                        return {"address": match.group(1)}
         except Exception as e:
-            print(f"Error fetching property details: {e}")
+            logger.warning("Error fetching property details: %s", e)
         
         return None
     
@@ -122,9 +179,30 @@ class PropertyURLParser:
         Parse a property URL (Zillow or Realtor.com).
         Returns property information if successful.
         """
-        if "zillow.com" in url.lower():
-            return PropertyURLParser.parse_zillow_url(url)
-        elif "realtor.com" in url.lower():
-            return PropertyURLParser.parse_realtor_url(url)
-        else:
-            return None
+        info = _parse_property_url(url)
+        # Hand out a copy so callers can't mutate the cached entry
+        return dict(info) if info is not None else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_property_url(url: str) -> Optional[Dict[str, str]]:
+    """Route a listing URL to its parser; a pure function of the URL, so memoized."""
+    try:
+        parsed = urlparse(url)
+        if parsed.hostname is None and "//" not in url:
+            # Bare "www.zillow.com/..." pasted without a scheme
+            parsed = urlparse("//" + url)
+    except ValueError:
+        return None
+    host = parsed.hostname or ""
+    if _on_domain(host, "zillow.com"):
+        return PropertyURLParser.parse_zillow_url(url, parsed)
+    elif _on_domain(host, "realtor.com"):
+        return PropertyURLParser.parse_realtor_url(url, parsed)
+    else:
+        return None
+
+
+def _on_domain(host: str, domain: str) -> bool:
+    """True if host (already lowercased) is domain or one of its subdomains."""
+    return host == domain or host.endswith("." + domain)
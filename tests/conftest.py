@@ -0,0 +1,109 @@
+"""Shared fixtures: a RentCast API served by httpx.MockTransport."""
+
+import asyncio
+import os
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+import httpx
+import pytest
+
+# rentcast_client refuses to import without a key
+os.environ["RENTCAST_API_KEY"] = os.getenv("RENTCAST_API_KEY") or "test-key"
+
+from betterdeal import web_app  # noqa: E402
+from betterdeal.analysis_engine import PropertyAnalyzer  # noqa: E402
+from betterdeal.rentcast_client import RentCastClient  # noqa: E402
+
+PROPERTY_URL = "https://www.zillow.com/homedetails/1-Main-St-Austin-TX-78701/9_zpid/"
+
+PROPERTY = {
+    "formattedAddress": "1 Main St, Austin, TX 78701",
+    "price": 320000,
+    "rent": 2400,
+    "zipCode": "78701",
+    "bedrooms": 3,
+    "bathrooms": 2,
+    "squareFootage": 1500,
+    "propertyType": "Single Family",
+}
+SALE_LISTINGS = [
+    {"formattedAddress": "2 Main St", "price": 300000, "squareFootage": 1500},
+    {"formattedAddress": "3 Main St", "price": 200000, "squareFootage": 1000},
+]
+RENTAL_LISTINGS = [{"formattedAddress": "4 Main St", "price": 2000, "squareFootage": 1400}]
+VALUATION = {"price": 310000}
+RENT_ESTIMATE = {"rent": 2100}
+
+
+class FakeRentCast:
+    """RentCast responses by path, with a hit count per path.
+
+    `overrides` maps a path to a callable returning an httpx.Response (or a
+    coroutine of one), for failures and slow responses.
+    """
+
+    def __init__(self) -> None:
+        self.calls: Counter = Counter()
+        self.overrides: Dict[str, Any] = {}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/v1")
+        self.calls[path] += 1
+        override = self.overrides.get(path)
+        if override is not None:
+            response = override(request)
+            return await response if asyncio.iscoroutine(response) else response
+        if path == "/properties":
+            return httpx.Response(200, json=[PROPERTY])
+        if path == "/avm/value":
+            return httpx.Response(200, json=VALUATION)
+        if path == "/avm/rent/long-term":
+            return httpx.Response(200, json=RENT_ESTIMATE)
+        if path == "/markets":
+            return httpx.Response(200, json={"zipCode": "78701"})
+        if path == "/listings/sale":
+            return httpx.Response(200, json=SALE_LISTINGS)
+        if path == "/listings/rental":
+            return httpx.Response(200, json=RENTAL_LISTINGS)
+        return httpx.Response(404, json={})
+
+
+class MockedRentCastClient(RentCastClient):
+    """RentCastClient whose requests go to a FakeRentCast instead of the network."""
+
+    def __init__(self, rentcast: FakeRentCast) -> None:
+        super().__init__()
+        self._transport = httpx.MockTransport(rentcast)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=self.base_url, transport=self._transport)
+        return self._client
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def rentcast() -> FakeRentCast:
+    return FakeRentCast()
+
+
+@asynccontextmanager
+async def running_app(rentcast: FakeRentCast) -> AsyncIterator[httpx.AsyncClient]:
+    """The web app with fresh state, its analyzer wired to `rentcast`."""
+    async with web_app.lifespan(web_app.app):
+        web_app.app.state.analyzer = PropertyAnalyzer(
+            rentcast_client=MockedRentCastClient(rentcast)
+        )
+        transport = httpx.ASGITransport(app=web_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+
+def analyze_body(**fields: Any) -> Dict[str, Any]:
+    return {"property_url": PROPERTY_URL, **fields}
@@ -0,0 +1,25 @@
+"""Property data fallbacks of PropertyAnalyzer.analyze_property."""
+
+from typing import Optional
+
+import httpx
+import pytest
+from conftest import PROPERTY_URL, RENT_ESTIMATE, FakeRentCast, MockedRentCastClient
+
+from betterdeal.analysis_engine import PropertyAnalyzer
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("estimated_rent", [None, 0])
+async def test_empty_search_uses_fallback_rent_estimate(
+    rentcast: FakeRentCast, estimated_rent: Optional[float]
+) -> None:
+    rentcast.overrides["/properties"] = lambda request: httpx.Response(200, json=[])
+    analyzer = PropertyAnalyzer(rentcast_client=MockedRentCastClient(rentcast))
+
+    result = await analyzer.analyze_property(PROPERTY_URL, estimated_rent=estimated_rent)
+
+    assert "error" not in result
+    assert result["core_metrics"]["gross_rental_income"] == RENT_ESTIMATE["rent"] * 12
+    assert rentcast.calls["/avm/rent/long-term"] == 1
@@ -0,0 +1,68 @@
+"""Retry and Retry-After handling of RentCastClient."""
+
+from typing import List
+
+import httpx
+import pytest
+from conftest import PROPERTY, FakeRentCast, MockedRentCastClient
+
+from betterdeal import rentcast_client
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """Backoff delays requested by the client, without actually waiting."""
+    delays: List[float] = []
+    real_sleep = rentcast_client.asyncio.sleep
+
+    async def fake_sleep(delay: float, *args: object) -> None:
+        # asyncio.sleep is patched module-wide; sleep(0) elsewhere is just a yield
+        if delay:
+            delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(rentcast_client.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def fail_first(*responses: httpx.Response):
+    """Override returning each of `responses` once, then falling through to 200."""
+    queue = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return queue.pop(0) if queue else httpx.Response(200, json=[PROPERTY])
+    return handler
+
+
+async def test_rate_limit_honors_capped_retry_after(
+    rentcast: FakeRentCast, sleeps: List[float]
+) -> None:
+    rentcast.overrides["/properties"] = fail_first(
+        httpx.Response(429, headers={"Retry-After": "60"}),
+    )
+    client = MockedRentCastClient(rentcast)
+
+    assert await client.search_properties_by_address("1 Main St") == [PROPERTY]
+    assert sleeps == [rentcast_client.MAX_RETRY_AFTER]
+    assert rentcast.calls["/properties"] == 2
+
+
+async def test_gateway_errors_back_off_exponentially(
+    rentcast: FakeRentCast, sleeps: List[float]
+) -> None:
+    rentcast.overrides["/properties"] = fail_first(httpx.Response(503), httpx.Response(502))
+    client = MockedRentCastClient(rentcast)
+
+    assert await client.search_properties_by_address("1 Main St") == [PROPERTY]
+    assert sleeps == [0.2, 0.4]
+
+
+async def test_gives_up_after_max_tries(rentcast: FakeRentCast, sleeps: List[float]) -> None:
+    rentcast.overrides["/properties"] = lambda request: httpx.Response(503)
+    client = MockedRentCastClient(rentcast)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.search_properties_by_address("1 Main St")
+    assert rentcast.calls["/properties"] == 3
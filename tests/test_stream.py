@@ -0,0 +1,119 @@
+"""NDJSON streaming of /api/analyze/stream."""
+
+import asyncio
+import zlib
+
+import httpx
+import orjson
+import pytest
+from conftest import SALE_LISTINGS, FakeRentCast, analyze_body, running_app
+
+from betterdeal import web_app
+
+pytestmark = pytest.mark.anyio
+
+
+def ndjson(response: httpx.Response) -> list:
+    return [orjson.loads(line) for line in response.content.splitlines()]
+
+
+async def test_stream_sends_results_then_comparables(rentcast: FakeRentCast) -> None:
+    async with running_app(rentcast) as client:
+        response = await client.post("/api/analyze/stream", json=analyze_body())
+    assert response.headers["content-type"] == "application/x-ndjson"
+    results, comps = ndjson(response)
+    assert "comparables" not in results
+    assert results["loan_details"]["purchase_price"] == 320000
+    assert len(comps["comparables"]["sale_comps"]) == 2
+
+
+async def test_stream_errors_are_not_cached(rentcast: FakeRentCast) -> None:
+    rentcast.overrides["/properties"] = lambda request: httpx.Response(500, json={})
+
+    async with running_app(rentcast) as client:
+        failed = await client.post("/api/analyze/stream", json=analyze_body())
+        assert "error" in ndjson(failed)[0]
+        assert web_app.app.state.result_cache == {}
+
+        del rentcast.overrides["/properties"]
+        recovered = await client.post("/api/analyze/stream", json=analyze_body())
+
+    assert len(ndjson(recovered)) == 2
+    assert rentcast.calls["/properties"] == 2
+
+
+async def test_unexpected_errors_are_logged_not_streamed(
+    rentcast: FakeRentCast, caplog: pytest.LogCaptureFixture
+) -> None:
+    async def broken_stream(**kwargs):
+        raise RuntimeError("internal detail")
+        yield {}
+
+    async with running_app(rentcast) as client:
+        web_app.app.state.analyzer.analyze_property_stream = broken_stream
+        response = await client.post("/api/analyze/stream", json=analyze_body())
+
+    assert ndjson(response) == [{"error": "Analysis failed"}]
+    assert "internal detail" in caplog.text
+
+
+async def test_first_line_arrives_before_comparables(rentcast: FakeRentCast) -> None:
+    """Line 1 reaches the client, even one accepting gzip, while comps are pending."""
+    release_comps = asyncio.Event()
+
+    async def held_listings(request: httpx.Request) -> httpx.Response:
+        await release_comps.wait()
+        return httpx.Response(200, json=SALE_LISTINGS)
+
+    rentcast.overrides["/listings/sale"] = held_listings
+
+    # Driven at the ASGI level: httpx.ASGITransport buffers the whole body
+    body = orjson.dumps(analyze_body())
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "POST", "scheme": "http", "path": "/api/analyze/stream",
+        "raw_path": b"/api/analyze/stream", "root_path": "", "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), (b"accept-encoding", b"gzip")],
+        "server": ("test", 80), "client": ("127.0.0.1", 1234),
+    }
+    requested = False
+
+    async def receive() -> dict:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.Event().wait()  # the client never disconnects
+        return {"type": "http.disconnect"}
+
+    messages: asyncio.Queue = asyncio.Queue()
+
+    async with running_app(rentcast):
+        app_task = asyncio.create_task(web_app.app(scope, receive, messages.put))
+        try:
+            start = await asyncio.wait_for(messages.get(), timeout=5)
+            headers = dict(start["headers"])
+            decoder = (
+                zlib.decompressobj(16 + zlib.MAX_WBITS)
+                if headers.get(b"content-encoding") == b"gzip" else None
+            )
+
+            async def read_line() -> dict:
+                data = b""
+                while b"\n" not in data:
+                    message = await asyncio.wait_for(messages.get(), timeout=1)
+                    chunk = message.get("body", b"")
+                    data += decoder.decompress(chunk) if decoder else chunk
+                return orjson.loads(data)
+
+            results = await read_line()
+            assert "comparables" not in results
+            assert "loan_details" in results
+
+            release_comps.set()
+            comps = await read_line()
+            assert len(comps["comparables"]["sale_comps"]) == 2
+            await asyncio.wait_for(app_task, timeout=5)
+        finally:
+            release_comps.set()
+            app_task.cancel()
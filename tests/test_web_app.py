@@ -0,0 +1,107 @@
+"""Result cache, single-flight sharing and timeouts of /api/analyze, and the landing page."""
+
+import asyncio
+
+import httpx
+import pytest
+from conftest import PROPERTY, FakeRentCast, analyze_body, running_app
+
+from betterdeal import web_app
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_analyze_returns_result(rentcast: FakeRentCast) -> None:
+    async with running_app(rentcast) as client:
+        response = await client.post("/api/analyze", json=analyze_body())
+    assert response.status_code == 200
+    result = response.json()
+    assert "error" not in result
+    assert result["loan_details"]["purchase_price"] == 320000
+
+
+async def test_identical_requests_are_served_from_cache(rentcast: FakeRentCast) -> None:
+    async with running_app(rentcast) as client:
+        first = await client.post("/api/analyze", json=analyze_body())
+        second = await client.post("/api/analyze", json=analyze_body())
+    assert first.content == second.content
+    assert rentcast.calls["/properties"] == 1
+
+
+async def test_identical_concurrent_requests_hit_rentcast_once(rentcast: FakeRentCast) -> None:
+    async def slow_search(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=[PROPERTY])
+
+    rentcast.overrides["/properties"] = slow_search
+
+    async with running_app(rentcast) as client:
+        analyzer = web_app.app.state.analyzer
+        runs = 0
+        analyze = analyzer.analyze_property
+
+        async def counting_analyze(**kwargs):
+            nonlocal runs
+            runs += 1
+            return await analyze(**kwargs)
+
+        analyzer.analyze_property = counting_analyze
+        responses = await asyncio.gather(
+            *(client.post("/api/analyze", json=analyze_body()) for _ in range(4))
+        )
+
+    assert [r.status_code for r in responses] == [200] * 4
+    assert len({r.content for r in responses}) == 1
+    assert runs == 1
+    assert rentcast.calls["/properties"] == 1
+
+
+async def test_errors_are_not_cached(rentcast: FakeRentCast) -> None:
+    # A non-retried upstream failure comes back from the analyzer as {"error": ...}
+    rentcast.overrides["/properties"] = lambda request: httpx.Response(500, json={})
+
+    async with running_app(rentcast) as client:
+        failed = await client.post("/api/analyze", json=analyze_body())
+        assert "error" in failed.json()
+
+        del rentcast.overrides["/properties"]
+        recovered = await client.post("/api/analyze", json=analyze_body())
+
+    assert "error" not in recovered.json()
+    assert rentcast.calls["/properties"] == 2
+
+
+async def test_slow_upstream_maps_to_504(
+    rentcast: FakeRentCast, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def stalled(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(5)
+        return httpx.Response(200, json=[])
+
+    rentcast.overrides["/properties"] = stalled
+    monkeypatch.setattr(web_app, "ANALYZE_TIMEOUT", 0.05)
+
+    async with running_app(rentcast) as client:
+        response = await client.post("/api/analyze", json=analyze_body())
+        assert response.status_code == 504
+        assert response.json() == {"detail": "upstream timeout"}
+        assert web_app.app.state.result_cache == {}
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "content_encoding"),
+    [
+        ("gzip, deflate", "gzip"),
+        ("deflate, gzip;q=0.5", "gzip"),
+        ("gzip;q=0", "identity"),
+        ("", "identity"),
+    ],
+)
+async def test_index_is_gzipped_only_when_accepted(
+    rentcast: FakeRentCast, accept_encoding: str, content_encoding: str
+) -> None:
+    async with running_app(rentcast) as client:
+        response = await client.get("/", headers={"Accept-Encoding": accept_encoding})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == content_encoding
+    assert response.content == web_app._INDEX_HTML